@@ -19,4 +19,8 @@ AUTORES_FILE = RAW_DATA_DIR / 'proposicoesAutores-2025.json'
 FILTERED_FILE = INTERIM_DATA_DIR / 'proposicoes-final-completo.json'
 
 # Arquivo Final (Processed) - Gerado pelo script extrair_texto.py
-FINAL_FILE = PROCESSED_DATA_DIR / 'proposicoes-com-texto-limpo.json'
\ No newline at end of file
+FINAL_FILE = PROCESSED_DATA_DIR / 'proposicoes-com-texto-limpo.json'
+
+# Checkpoint incremental (JSONL) - Gravado pelo extrair_texto.py a cada PDF processado,
+# permitindo retomar a execução após uma interrupção
+CHECKPOINT_FILE = PROCESSED_DATA_DIR / 'proposicoes-com-texto-limpo.jsonl'
\ No newline at end of file
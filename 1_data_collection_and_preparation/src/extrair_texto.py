@@ -17,26 +17,67 @@ Saída:
     Gera um novo JSON enriquecido com o campo 'textoInteiroTeorLimpo'.
 """
 
-import json
+import os
 import re
-import requests
+import time
+import multiprocessing
+import queue
+import threading
+import httpx
+import orjson
 import fitz  # PyMuPDF
-from collections import Counter
-from typing import Optional, List, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Optional, List, Tuple, Dict, FrozenSet, Iterator, Set
 
 try:
     import config
 except ImportError:
     from src import config
 
+# Backend alternativo (opcional) baseado no PDFium, mais rápido para extração de texto
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 # ------------------------------- 
 # CONSTANTES E CONFIGURAÇÕES
 # ------------------------------- 
 
 INPUT_FILE  = config.FILTERED_FILE
 OUTPUT_FILE = config.FINAL_FILE
+CHECKPOINT_FILE = config.CHECKPOINT_FILE
 # Cabeçalho HTTP para simular um navegador e evitar bloqueios
 HEADERS = {"User-Agent": "Mozilla/5.0"}
+# Número de PDFs baixados em paralelo (o tempo é dominado pela espera de rede)
+MAX_WORKERS = 32
+# Número de processos dedicados à extração/limpeza dos PDFs (etapa limitada por CPU)
+PARSE_WORKERS = os.cpu_count() or 1
+# Máximo de PDFs baixados aguardando/em extração; limita a memória quando o download é mais rápido que o parsing
+MAX_PENDING_PARSES = 2 * PARSE_WORKERS
+
+# Biblioteca usada para ler os PDFs: "pymupdf" (padrão) ou "pdfium" (requer pypdfium2).
+# Se "pdfium" for escolhido sem o pacote instalado, o PyMuPDF é usado como fallback.
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pymupdf").lower()
+
+# Falhas transitórias (limite de requisições, erros 5xx) são repetidas com backoff exponencial
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+
+# Cliente HTTP compartilhado entre as threads. Com HTTP/2 (quando o servidor suporta),
+# os downloads simultâneos são multiplexados em poucas conexões TLS com o servidor da
+# Câmara; em HTTP/1.1 as conexões continuam sendo reaproveitadas (keep-alive).
+_CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=50,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,  # Repete falhas de conexão
+        limits=httpx.Limits(max_connections=2 * MAX_WORKERS, max_keepalive_connections=MAX_WORKERS),
+    ),
+)
 
 # --- Parâmetros da Heurística de Limpeza ---
 
@@ -77,6 +118,36 @@ BANNED_SUBSTRS = [
     "gabinete",
 ]
 
+# --- Expressões Regulares Pré-compiladas ---
+# Compiladas uma única vez na importação do módulo, pois são aplicadas
+# a cada linha de cada página de cada PDF.
+
+# Sequências de 3 ou mais caracteres de pontuação/marcadores (ex: ".......")
+_RE_DOTS = re.compile(r'[_\'\.\·•●◦▪▫⋅∙…]{3,}')
+# Espaços em branco consecutivos
+_RE_WS = re.compile(r'\s+')
+
+# Numeração de página: "3", "Página 3 de 10" e "3/25"
+_RE_PAGENUM_NUM = re.compile(r'\d{1,4}')
+_RE_PAGENUM_PAGINA = re.compile(r'p[áa]gina\s+\d{1,4}(\s+de\s+\d{1,4})?', re.IGNORECASE)
+_RE_PAGENUM_SLASH = re.compile(r'\d{1,4}\s*/\s*\d{1,4}')
+
+# Regras de remoção global (ver `should_remove_global`):
+# - Linha que é só a identificação curta do PL (ex: "PL 1234/2025", "PL nº 1234/2025")
+_PL_SHORT_PATTERN = r'^\s*pl\s*n?º?\s*\d{1,6}[/-]\d{2,4}\s*\Z'
+# - Códigos de protocolo internos (estilo "*CD257150518000*")
+_CD_PROTO_PATTERN = r'(?:\*|^)\s*cd\d{6,}\s*(?:\*|$)'
+# - Qualquer termo banido
+_BANNED_PATTERN = '|'.join(re.escape(b) for b in BANNED_SUBSTRS)
+# Todas as regras fundidas em uma única alternação insensível a maiúsculas/minúsculas:
+# a decisão por linha vira uma só chamada ao motor de regex (em C), sem cópias da linha.
+_RE_REMOVE_GLOBAL = re.compile(
+    '|'.join((_PL_SHORT_PATTERN, _CD_PROTO_PATTERN, _BANNED_PATTERN)), re.IGNORECASE
+)
+
+# Título de anexo: "ANEXO", "ANEXO I", "ANEXO 2 - TABELA", etc.
+_RE_ANNEX_TITLE = re.compile(r'^ANEXO(\s+[IVXLCDM0-9]+)?(\s*[-–—:].*)?$')
+
 
 # ------------------------
 # UTILITÁRIOS DE TEXTO
@@ -87,11 +158,8 @@ def normalize_line(s: str) -> str:
     Remove ruídos visuais como linhas pontilhadas longas e normaliza espaços.
     Exemplo: "......." é transformado em " ".
     """
-    # Remove sequências de 3 ou mais caracteres de pontuação/marcadores
-    s = re.sub(r'[_\'\.\·•●◦▪▫⋅∙…]{3,}', ' ', s)
-    # Colapsa múltiplos espaços em um único
-    s = re.sub(r'\s+', ' ', s)
-    return s.strip()
+    # Remove sequências de pontuação/marcadores e colapsa múltiplos espaços em um único
+    return _RE_WS.sub(' ', _RE_DOTS.sub(' ', s)).strip()
 
 def is_page_number(line: str) -> bool:
     """
@@ -100,13 +168,13 @@ def is_page_number(line: str) -> bool:
     """
     t = line.strip()
     # Apenas números (ex: "3")
-    if re.fullmatch(r'\d{1,4}', t):
+    if _RE_PAGENUM_NUM.fullmatch(t):
         return True
     # Formato "Página X" ou "Página X de Y"
-    if re.fullmatch(r'(?i)p[áa]gina\s+\d{1,4}(\s+de\s+\d{1,4})?', t):
+    if _RE_PAGENUM_PAGINA.fullmatch(t):
         return True
     # Formato "X/Y"
-    if re.fullmatch(r'\d{1,4}\s*/\s*\d{1,4}', t):
+    if _RE_PAGENUM_SLASH.fullmatch(t):
         return True
     return False
 
@@ -117,21 +185,7 @@ def should_remove_global(line: str) -> bool:
     """
     if not line:
         return False
-    l = line.casefold()
-
-    # Verifica se contém algum termo banido
-    if any(b in l for b in BANNED_SUBSTRS):
-        return True
-
-    # Remove códigos de protocolo internos (estilo "*CD257150518000*")
-    if re.search(r'(\*|^)\s*cd\d{6,}\s*(\*|$)', l):
-        return True
-
-    # Remove identificação curta do PL (ex: "PL 1234/2025") quando aparece solta no texto
-    if re.fullmatch(r'(?i)pl\s*n?`\.IBLE?s*\d{1,6}[/-]\d{2,4}', line.strip()):
-        return True
-
-    return False
+    return _RE_REMOVE_GLOBAL.search(line) is not None
 
 
 # ------------------------
@@ -140,51 +194,122 @@ def should_remove_global(line: str) -> bool:
 
 def extract_blocks(page: fitz.Page) -> List[Tuple[Tuple[float, float, float, float], str]]:
     """
-    Extrai blocos de texto e suas coordenadas (Bounding Box) de uma página.
-    
+    Extrai as linhas de texto e suas coordenadas (Bounding Box) de uma página.
+
+    Usa o modo "dict" do PyMuPDF, que já entrega cada linha com sua própria
+    bbox, permitindo que as heurísticas de cabeçalho/rodapé usem a posição
+    real da linha (e não a do bloco inteiro). As flags TEXTFLAGS_TEXT evitam
+    que o MuPDF extraia os dados binários das imagens (logos, assinaturas),
+    que o modo "dict" inclui por padrão e que seriam descartados aqui.
+
     Retorna:
         Lista de tuplas no formato ((x0, y0, x1, y1), texto_normalizado)
     """
-    blocks = page.get_text("blocks")
     out = []
-    for (x0, y0, x1, y1, text, *_rest) in blocks:
-        for line in text.splitlines():
-            ln = normalize_line(line)
+    for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]:
+        # Blocos de imagem não possuem a chave "lines"
+        for line in block.get("lines", ()):
+            ln = normalize_line("".join(span["text"] for span in line["spans"]))
             if ln:
-                out.append(((x0, y0, x1, y1), ln))
+                out.append((tuple(line["bbox"]), ln))
     return out
 
-def detect_headers_footers(pages_lines: List[List], heights: List[float]) -> Tuple[Set[str], Set[str]]:
+def extract_blocks_pdfium(textpage, height: float) -> List[Tuple[Tuple[float, float, float, float], str]]:
+    """
+    Equivalente a `extract_blocks` para o backend PDFium (pypdfium2).
+
+    O PDFium devolve retângulos de texto com origem no canto inferior esquerdo;
+    as coordenadas são convertidas para a origem no topo, como no PyMuPDF,
+    para que as heurísticas de cabeçalho/rodapé funcionem igualmente.
+
+    Retorna:
+        Lista de tuplas no formato ((x0, y0, x1, y1), texto_normalizado)
+    """
+    out = []
+    for i in range(textpage.count_rects()):
+        left, bottom, right, top = textpage.get_rect(i)
+        ln = normalize_line(textpage.get_text_bounded(left, bottom, right, top))
+        if ln:
+            out.append(((left, height - top, right, height - bottom), ln))
+    return out
+
+def iter_pages(doc):
+    """
+    Percorre as páginas do documento, independente do backend, gerando
+    tuplas (altura_da_pagina, linhas) com as linhas no formato de `extract_blocks`.
+    """
+    if pdfium is not None and isinstance(doc, pdfium.PdfDocument):
+        for page in doc:
+            h = page.get_height()
+            textpage = page.get_textpage()
+            try:
+                yield h, extract_blocks_pdfium(textpage, h)
+            finally:
+                textpage.close()
+                page.close()
+    else:
+        for page in doc:
+            yield page.rect.height, extract_blocks(page)
+
+def mark_lines(lines: List, top_y: float, bot_y: float,
+               pagenum_cache: Dict[str, bool]) -> List[Tuple[float, str, bool, bool, bool]]:
+    """
+    Anota cada linha de uma página com sua posição em relação às faixas de topo e base.
+
+    A pertinência às faixas é calculada uma única vez aqui e reaproveitada tanto
+    na detecção de cabeçalhos/rodapés quanto na filtragem final. A verificação de
+    numeração de página só é feita para linhas dentro das faixas, e o resultado é
+    memorizado em `pagenum_cache` (textos como "1", "2"... se repetem entre páginas).
+
+    Retorna:
+        Lista de tuplas no formato (y0, texto, no_topo, na_base, numero_de_pagina)
+    """
+    out = []
+    for (bbox, line) in lines:
+        y0 = bbox[1]
+        in_top = y0 <= top_y
+        in_bot = y0 >= bot_y
+        pagenum = False
+        if in_top or in_bot:
+            pagenum = pagenum_cache.get(line)
+            if pagenum is None:
+                pagenum = pagenum_cache[line] = is_page_number(line)
+        out.append((y0, line, in_top, in_bot, pagenum))
+    return out
+
+def detect_headers_footers(pages_marked: List[List]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
     """
     Identifica cabeçalhos e rodapés baseando-se na repetição de texto entre páginas.
     
     Lógica: Se um texto aparece no topo (ou base) de muitas páginas (definido por REPEAT_THRESHOLD),
     ele é classificado como cabeçalho (ou rodapé) e será removido de todas as páginas.
-    """
-    top_c = Counter()
-    bot_c = Counter()
-    n = len(pages_lines)
 
-    for i, lines in enumerate(pages_lines):
-        h = heights[i]
-        top_y = h * TOP_FRAC
-        bot_y = h * (1 - BOTTOM_FRAC)
-        st = set()
-        sb = set()
-        for (bbox, line) in lines:
-            y0 = bbox[1]
+    Args:
+        pages_marked: Linhas de cada página já anotadas por `mark_lines`.
+    """
+    top_c: Dict[str, int] = {}
+    bot_c: Dict[str, int] = {}
+    n = len(pages_marked)
+
+    for lines in pages_marked:
+        # Cada texto conta no máximo uma vez por página
+        seen_top = set()
+        seen_bot = set()
+        for (_y0, line, in_top, in_bot, pagenum) in lines:
             # Coleta candidatos no topo (exceto números de página que variam a cada página)
-            if y0 <= top_y and not is_page_number(line):
-                st.add(line)
+            if in_top and not pagenum and line not in seen_top:
+                seen_top.add(line)
+                top_c[line] = top_c.get(line, 0) + 1
             # Coleta candidatos no rodapé
-            if y0 >= bot_y:
-                sb.add(line)
-        top_c.update(st)
-        bot_c.update(sb)
-
-    # Filtra apenas os textos que aparecem em X% das páginas (limiar definido)
-    top_rep = {l for l, c in top_c.items() if c >= REPEAT_THRESHOLD * n}
-    bot_rep = {l for l, c in bot_c.items() if c >= REPEAT_THRESHOLD * n}
+            if in_bot and line not in seen_bot:
+                seen_bot.add(line)
+                bot_c[line] = bot_c.get(line, 0) + 1
+
+    # Filtra apenas os textos que aparecem em X% das páginas (limiar definido).
+    # A comparação é feita em inteiros (percentual) para evitar aritmética de ponto flutuante.
+    min_pct = round(REPEAT_THRESHOLD * 100) * n
+    top_rep = frozenset(l for l, c in top_c.items() if c * 100 >= min_pct)
+    bot_rep = frozenset(l for l, c in bot_c.items() if c * 100 >= min_pct)
     return top_rep, bot_rep
 
 
@@ -200,7 +325,7 @@ def looks_like_annex_title(line: str) -> bool:
     s = line.strip()
 
     # Regex para identificar "ANEXO I", "ANEXO ÚNICO", etc.
-    if not re.match(r'^ANEXO(\s+[IVXLCDM0-9]+)?(\s*[-–—:].*)?$', s):
+    if not _RE_ANNEX_TITLE.match(s):
         return False
 
     # Evita falsos positivos (frases longas ou terminadas em ponto final)
@@ -220,19 +345,18 @@ def looks_like_annex_title(line: str) -> bool:
 
     return True
 
-def find_annex_start_page(pages_lines, heights) -> Optional[int]:
+def find_annex_start_page(pages_marked, heights) -> Optional[int]:
     """
     Localiza a página onde o Anexo começa.
     Geralmente anexos aparecem apenas no final do documento.
     """
     candidates = []
-    n_pages = len(pages_lines)
+    n_pages = len(pages_marked)
 
-    for i, lines in enumerate(pages_lines):
+    for i, lines in enumerate(pages_marked):
         h = heights[i]
         top_limit = h * TOP_FRAC_ANNEX
-        for (bbox, line) in lines:
-            y0 = bbox[1]
+        for (y0, line, *_flags) in lines:
             if y0 <= top_limit and looks_like_annex_title(line):
                 candidates.append(i)
                 break 
@@ -256,43 +380,39 @@ def get_pdf_text_clean_from_doc(doc) -> Optional[str]:
     """
     Orquestra a extração e limpeza de um documento PDF já aberto.
     """
-    pages_lines, heights = [], []
+    pages_marked, heights = [], []
+    pagenum_cache: Dict[str, bool] = {}
 
-    # 1. Extração bruta de blocos com coordenadas
-    for p in doc:
-        heights.append(p.rect.height)
-        pages_lines.append(extract_blocks(p))
+    # 1. Extração bruta de linhas com coordenadas, já anotadas com as faixas de topo/base
+    for h, lines in iter_pages(doc):
+        heights.append(h)
+        pages_marked.append(mark_lines(lines, h * TOP_FRAC, h * (1 - BOTTOM_FRAC), pagenum_cache))
 
     # 2. Identificação de padrões repetitivos (Cabeçalhos/Rodapés)
-    top_rep, bot_rep = detect_headers_footers(pages_lines, heights)
+    top_rep, bot_rep = detect_headers_footers(pages_marked)
 
     # 3. Detecção de corte de anexo (se habilitado)
-    annex_start = find_annex_start_page(pages_lines, heights) if REMOVE_FROM_ANEXO else None
+    annex_start = find_annex_start_page(pages_marked, heights) if REMOVE_FROM_ANEXO else None
     if DEBUG_LOG and annex_start is not None:
         print(f"[INFO] ANEXO detectado na página {annex_start + 1}. Cortando conteúdo posterior.")
 
     cleaned_pages: List[str] = []
 
     # 4. Filtragem linha a linha
-    for i, lines in enumerate(pages_lines):
+    for i, lines in enumerate(pages_marked):
 
         # Se detectou início de anexo, para a extração aqui
         if annex_start is not None and i >= annex_start:
             break
 
-        h = heights[i]
-        top_y = h * TOP_FRAC
-        bottom_y = h * (1 - BOTTOM_FRAC)
-
         keep = []
-        for (bbox, line) in lines:
-            y0 = bbox[1]
+        for (_y0, line, in_top, in_bot, pagenum) in lines:
 
-            # Aplica regras de exclusão
+            # Aplica regras de exclusão (das mais baratas para a mais cara)
+            if in_top and line in top_rep: continue
+            if in_bot and line in bot_rep: continue
+            if pagenum: continue
             if should_remove_global(line): continue
-            if line in top_rep and y0 <= top_y: continue
-            if line in bot_rep and y0 >= bottom_y: continue
-            if is_page_number(line) and (y0 <= top_y or y0 >= bottom_y): continue
 
             keep.append(line)
 
@@ -303,18 +423,98 @@ def get_pdf_text_clean_from_doc(doc) -> Optional[str]:
     text = "\n".join(cleaned_pages).strip()
     return text or None
 
-def extract_pdf_from_url(url: str) -> Optional[str]:
-    """Baixa o PDF da URL e inicia o processamento."""
+def download_pdf(url: str) -> Optional[bytes]:
+    """Baixa o PDF da URL e retorna seu conteúdo bruto (ou None em caso de falha)."""
     try:
-        r = requests.get(url, headers=HEADERS, timeout=50)
+        for attempt in range(MAX_RETRIES + 1):
+            r = _CLIENT.get(url)
+            if r.status_code not in RETRY_STATUS or attempt == MAX_RETRIES:
+                break
+            time.sleep(BACKOFF_FACTOR * 2 ** attempt)
         r.raise_for_status()
-        doc = fitz.open(stream=r.content, filetype="pdf")
-        return get_pdf_text_clean_from_doc(doc)
+        return r.content
+    except Exception as e:
+        if DEBUG_LOG:
+            print(f"[ERRO] Falha ao baixar PDF: {e}")
+        return None
+
+def download_pdf_for_parse(url: str, slots: threading.BoundedSemaphore) -> Optional[bytes]:
+    """
+    Baixa o PDF e reserva uma vaga de extração antes de devolver os bytes.
+
+    A vaga é liberada quando a extração termina; enquanto não houver vaga, a thread
+    de download espera, o que impede que PDFs baixados se acumulem na memória.
+    """
+    pdf_bytes = download_pdf(url)
+    if pdf_bytes is not None:
+        slots.acquire()
+    return pdf_bytes
+
+def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> Optional[str]:
+    """
+    Abre o PDF a partir dos bytes baixados e executa a extração com limpeza.
+
+    Recebe bytes (e não um documento aberto) porque é executada em outro
+    processo, e os objetos do PyMuPDF não podem ser serializados.
+    """
+    try:
+        if PDF_BACKEND == "pdfium" and pdfium is not None:
+            doc = pdfium.PdfDocument(pdf_bytes)
+            try:
+                return get_pdf_text_clean_from_doc(doc)
+            finally:
+                doc.close()
+        # O documento é fechado explicitamente para liberar a memória do MuPDF
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            return get_pdf_text_clean_from_doc(doc)
     except Exception as e:
         if DEBUG_LOG:
-            print(f"[ERRO] Falha ao baixar/processar PDF: {e}")
+            print(f"[ERRO] Falha ao processar PDF: {e}")
         return None
 
+def extract_pdf_from_url(url: str) -> Optional[str]:
+    """Baixa o PDF da URL e inicia o processamento."""
+    pdf_bytes = download_pdf(url)
+    if pdf_bytes is None:
+        return None
+    return extract_text_from_pdf_bytes(pdf_bytes)
+
+
+# ------------------------
+# CHECKPOINT INCREMENTAL
+# ------------------------
+
+def iter_checkpoint(path) -> Iterator[Dict[str, Any]]:
+    """
+    Percorre os registros {"id": ..., "textoInteiroTeorLimpo": ...} do checkpoint JSONL.
+
+    Linhas inválidas (ex: a última, truncada por uma interrupção) são ignoradas.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        for raw in f:
+            if not raw.strip():
+                continue
+            try:
+                yield orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                continue
+
+def load_checkpoint(path) -> Dict[Any, Optional[str]]:
+    """Lê o checkpoint JSONL e retorna {id: texto_limpo} das proposições já processadas."""
+    return {rec["id"]: rec["textoInteiroTeorLimpo"] for rec in iter_checkpoint(path)}
+
+def load_checkpoint_ids(path) -> Set[Any]:
+    """Retorna apenas os IDs já processados, sem manter os textos em memória."""
+    return {rec["id"] for rec in iter_checkpoint(path)}
+
+def append_checkpoint(f, prop_id: Any, texto: Optional[str]) -> None:
+    """Acrescenta um registro ao checkpoint e força a gravação em disco."""
+    f.write(orjson.dumps({"id": prop_id, "textoInteiroTeorLimpo": texto}) + b"\n")
+    f.flush()
+    os.fsync(f.fileno())
+
 
 # ------------------------
 # EXECUÇÃO DO SCRIPT
@@ -322,8 +522,8 @@ def extract_pdf_from_url(url: str) -> Optional[str]:
 if __name__ == "__main__":
     print(f"Lendo arquivo de entrada: {INPUT_FILE}")
     try:
-        with open(INPUT_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(INPUT_FILE, "rb") as f:
+            data = orjson.loads(f.read())
     except FileNotFoundError:
         print(f"[FATAL] Arquivo {INPUT_FILE} não encontrado. Execute 'filtrar_dados.py' primeiro.")
         exit(1)
@@ -340,24 +540,84 @@ if __name__ == "__main__":
     total = len(proposicoes)
     print(f"Total de proposições para processar: {total}")
 
-    for idx, prop in enumerate(proposicoes, start=1):
-        if not isinstance(prop, dict): continue
-
-        url = prop.get("urlInteiroTeor")
-        # Log de progresso simples
-        print(f"[{idx}/{total}] Processando ID {prop.get('id')}...")
-
-        if url:
-            texto_limpo = extract_pdf_from_url(url)
-            prop["textoInteiroTeorLimpo"] = texto_limpo
-        else:
-            prop["textoInteiroTeorLimpo"] = None
+    # Proposições já presentes no checkpoint de uma execução anterior são puladas
+    already_done = load_checkpoint_ids(CHECKPOINT_FILE)
+    if already_done:
+        print(f"Retomando execução: {len(already_done)} proposições já processadas em {CHECKPOINT_FILE}")
+
+    # Os textos extraídos não ficam em memória: cada resultado é gravado no checkpoint
+    # assim que fica pronto, e o JSON final é montado a partir dele ao término.
+    with open(CHECKPOINT_FILE, "ab") as ckpt:
+        # Garante que um registro truncado por uma interrupção não se junte ao próximo
+        if ckpt.tell() > 0:
+            ckpt.write(b"\n")
+
+        # Pipeline em duas etapas: os downloads rodam em um pool de threads (espera de rede)
+        # e, à medida que cada PDF chega, seus bytes são enviados a um pool de processos
+        # que faz a extração/limpeza (CPU). Cada futuro é associado ao ID da proposição.
+        # Os futuros das duas etapas avisam a mesma fila ao terminar, então um único laço
+        # consome downloads e extrações conforme ficam prontos, e cada texto vai para o
+        # checkpoint assim que é extraído (sem esperar o fim de todos os downloads).
+        # Cada PDF baixado ocupa uma vaga (parse_slots) até sua extração terminar, então no
+        # máximo MAX_PENDING_PARSES PDFs ficam na fila do parser, mesmo com downloads mais rápidos.
+        # Os processos de parsing não são criados por fork: um fork feito enquanto as
+        # threads de download estão ativas pode herdar locks presos e travar os filhos.
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as downloader, \
+                ProcessPoolExecutor(max_workers=PARSE_WORKERS,
+                                    mp_context=multiprocessing.get_context(start_method)) as parser:
+            finished = queue.SimpleQueue()
+            parse_slots = threading.BoundedSemaphore(MAX_PENDING_PARSES)
+            download_to_id = {}
+            for prop in proposicoes:
+                if not isinstance(prop, dict): continue
+
+                url = prop.get("urlInteiroTeor")
+                if url and prop.get("id") not in already_done:
+                    fut = downloader.submit(download_pdf_for_parse, url, parse_slots)
+                    download_to_id[fut] = prop.get("id")
+                    fut.add_done_callback(finished.put)
+
+            pending = len(download_to_id)
+            done = 0
+            parse_to_id = {}
+            while download_to_id or parse_to_id:
+                fut = finished.get()
+                if fut in download_to_id:
+                    # Remove o futuro do dicionário para que os bytes do PDF sejam liberados
+                    # assim que forem enviados ao parser (senão o corpus inteiro fica em memória)
+                    prop_id = download_to_id.pop(fut)
+                    pdf_bytes = fut.result()
+                    if pdf_bytes is not None:
+                        parse_fut = parser.submit(extract_text_from_pdf_bytes, pdf_bytes)
+                        parse_to_id[parse_fut] = prop_id
+                        parse_fut.add_done_callback(lambda _: parse_slots.release())
+                        parse_fut.add_done_callback(finished.put)
+                        del pdf_bytes, parse_fut
+                    else:
+                        # Falhas de download não entram no checkpoint, para serem tentadas na próxima execução
+                        done += 1
+                        print(f"[{done}/{pending}] Falha no download do ID {prop_id}")
+                else:
+                    prop_id = parse_to_id.pop(fut)
+                    append_checkpoint(ckpt, prop_id, fut.result())
+                    done += 1
+                    # Log de progresso simples (na ordem de conclusão)
+                    print(f"[{done}/{pending}] Processado ID {prop_id}")
+                del fut
+
+    # Monta o resultado final a partir do checkpoint, preservando a ordem original
+    textos = load_checkpoint(CHECKPOINT_FILE)
+    for prop in proposicoes:
+        if isinstance(prop, dict):
+            prop["textoInteiroTeorLimpo"] = textos.get(prop.get("id"))
 
     # Salva mantendo a estrutura compatível
     out = {"dados": proposicoes}
 
     print(f"Salvando resultados em: {OUTPUT_FILE}")
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    # orjson serializa direto para UTF-8 em C (sem escape ASCII), bem mais rápido que json.dump
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(out, option=orjson.OPT_INDENT_2))
 
     print("✅ Processamento finalizado com sucesso!")
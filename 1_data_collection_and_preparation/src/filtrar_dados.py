@@ -8,14 +8,14 @@ das proposições com as informações de autoria.
 Pipeline (Fluxo):
 1. Carregamento dos arquivos JSON brutos.
 2. Mapeamento de autores para suas respectivas proposições.
-3. União (Merge) das proposições com seus autores.
-4. Filtragem por tipo (PL, PEC, PLP) e intervalo de datas.
-5. Limpeza de campos desnecessários para reduzir o tamanho do arquivo.
-6. Salvamento do conjunto de dados intermediário.
+3. Em uma única passagem: filtragem por tipo (PL, PEC, PLP) e intervalo de datas,
+   união (Merge) das proposições com seus autores e limpeza de campos
+   desnecessários para reduzir o tamanho do arquivo.
+4. Salvamento do conjunto de dados intermediário.
 """
 
 import json
-from datetime import datetime, date
+from datetime import date
 from typing import List, Dict, Any, Optional
 
 try:
@@ -32,20 +32,25 @@ OUTPUT_FILE = config.FILTERED_FILE
 
 # Regras de Negócio
 # Tipos de proposição relevantes para a análise de NLP
-TIPOS_VALIDOS = {'PL', 'PEC', 'PLP'}
+TIPOS_VALIDOS = frozenset({'PL', 'PEC', 'PLP'})
 
 # Recorte temporal: 1º Semestre Legislativo de 2025 (Fevereiro a Julho)
 START_DATE = date(2025, 2, 2)
 END_DATE = date(2025, 7, 17)
 
+# Limites em formato ISO (AAAA-MM-DD): datas ISO-8601 ordenam lexicograficamente
+# da mesma forma que cronologicamente, então a comparação pode ser feita como string
+_START_ISO = START_DATE.isoformat()
+_END_ISO = END_DATE.isoformat()
+
 # Campos que serão removidos da proposição para economizar espaço e reduzir ruído
-PROPOSICAO_KEYS_TO_REMOVE = [
+PROPOSICAO_KEYS_TO_REMOVE = frozenset([
     'ultimoStatus',
     'uriOrgaoNumerador',
     'uriPropAnterior',
     'uriPropPrincipal',
     'uriPropPosterior'
-]
+])
 
 # Campos do objeto 'Autor' que serão mantidos
 AUTOR_KEYS_TO_KEEP = [
@@ -148,22 +153,12 @@ def main_pipeline():
     autores_map = process_autores_map(autores_list)
     print(f"   Mapa de autores criado.")
 
-    # 3. União (Merge) - Adiciona autores às proposições
-    merged_list = []
-    for prop in props_list:
-        prop_id = prop.get('id')
-        # Busca a lista de autores no mapa; retorna lista vazia se não houver
-        prop['autores'] = autores_map.get(prop_id, [])
-        merged_list.append(prop)
-    
-    print(f"   União de dados concluída.")
-
-    # 4. Filtragem (Regras de Negócio)
-    filtered_list = []
+    # 3. Filtragem, União (Merge) com autores e Limpeza de campos em uma única passagem
+    final_list = []
     # Contadores para relatório de exclusão
     removed_counts = {"tipo": 0, "data": 0, "vazia": 0}
 
-    for prop in merged_list:
+    for prop in props_list:
         # Filtra por Tipo de Proposição
         sigla_tipo = prop.get('siglaTipo')
         if sigla_tipo not in TIPOS_VALIDOS:
@@ -176,38 +171,33 @@ def main_pipeline():
             removed_counts["vazia"] += 1
             continue
             
-        try:
-            # Converte string ISO para objeto de data para comparação
-            data_ap = datetime.fromisoformat(data_str.split('T')[0]).date()
-            
-            if not (START_DATE <= data_ap <= END_DATE):
-                removed_counts["data"] += 1
-                continue
-        except ValueError:
+        # Compara apenas a parte da data ("AAAA-MM-DD") da string ISO, sem conversão
+        data_ap = data_str[:10]
+        if len(data_ap) != 10 or data_ap[4] != '-' or data_ap[7] != '-':
             removed_counts["vazia"] += 1
             continue
-            
-        # Se passou em todos os filtros, adiciona à lista final
-        filtered_list.append(prop)
-        
-    print(f"   Filtragem concluída. Registros removidos:")
-    print(f"     - Por Tipo invalido ({TIPOS_VALIDOS}): {removed_counts['tipo']}")
-    print(f"     - Fora do intervalo de data ({START_DATE} a {END_DATE}): {removed_counts['data']}")
-    print(f"     - Data inválida ou vazia: {removed_counts['vazia']}")
 
-    # 5. Limpeza Final de Campos
-    final_list = []
-    for prop in filtered_list:
+        if not (_START_ISO <= data_ap <= _END_ISO):
+            removed_counts["data"] += 1
+            continue
+
+        # Busca a lista de autores no mapa; retorna lista vazia se não houver
+        prop['autores'] = autores_map.get(prop.get('id'), [])
+
         # Remove chaves desnecessárias para o NLP
         for key in PROPOSICAO_KEYS_TO_REMOVE:
             prop.pop(key, None) # .pop() remove a chave se existir
-        
+
+        # Se passou em todos os filtros, adiciona à lista final
         final_list.append(prop)
         
-    print(f"   Limpeza de campos desnecessários concluída.")
+    print(f"   Filtragem, união e limpeza concluídas. Registros removidos:")
+    print(f"     - Por Tipo invalido ({', '.join(sorted(TIPOS_VALIDOS))}): {removed_counts['tipo']}")
+    print(f"     - Fora do intervalo de data ({START_DATE} a {END_DATE}): {removed_counts['data']}")
+    print(f"     - Data inválida ou vazia: {removed_counts['vazia']}")
     print(f">>> Total de registros prontos para extração de texto: {len(final_list)}")
 
-    # 6. Salvar Resultado
+    # 4. Salvar Resultado
     save_json_data(final_list, OUTPUT_FILE)
 
 # --- Execução do Script ---
@@ -4,6 +4,7 @@ __all__ = [
     "db",
     "repository",
     "openai_service",
+    "llm_cache",
     "use_cases",
     "utils",
     "extractor",
@@ -23,3 +23,6 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # Local file paths
 PROPOSITIONS_JSON = os.getenv("PROPOSITIONS_JSON", "./proposicoes.json")
+
+# On-disk cache of LLM responses (set to an empty string to disable)
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "./llm_cache.sqlite3")
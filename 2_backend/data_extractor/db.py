@@ -1,11 +1,25 @@
+import csv
+import io
 import logging
+import threading
 import psycopg2
-from psycopg2 import extras
-from typing import List, Tuple
+from contextlib import contextmanager
+from psycopg2 import extras, pool
+from typing import Iterator, List, Optional, Sequence, Tuple
 from .config import DB_NAME, DB_USER, DB_PASS, DB_HOST, DB_PORT
 
 logger = logging.getLogger(__name__)
 
+# Rows sent per INSERT statement by execute_values (psycopg2's default is 100)
+DEFAULT_PAGE_SIZE = 1000
+
+# Connection pool bounds. Up to POOL_MIN_CONN idle connections are kept open for reuse.
+POOL_MIN_CONN = 1
+POOL_MAX_CONN = 16
+
+_pool: Optional[pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
 
 def get_db_connection():
     """
@@ -23,13 +37,63 @@ def get_db_connection():
     )
 
 
-def execute_batch_insert(insert_sql: str, data: List[Tuple]) -> int:
+def _get_pool() -> pool.ThreadedConnectionPool:
+    """
+    Lazily create the shared thread-safe connection pool.
+
+    Returns:
+        The process-wide ThreadedConnectionPool instance.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pool.ThreadedConnectionPool(
+                    POOL_MIN_CONN,
+                    POOL_MAX_CONN,
+                    dbname=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASS,
+                    host=DB_HOST,
+                    port=DB_PORT
+                )
+    return _pool
+
+
+@contextmanager
+def borrow_conn() -> Iterator["psycopg2.extensions.connection"]:
+    """
+    Borrow a connection from the pool and return it when the block exits.
+
+    Reusing pooled connections avoids paying the TCP handshake and PostgreSQL
+    authentication on every batch. Any open transaction is rolled back if the
+    block raises; broken connections are discarded instead of returned.
+
+    Yields:
+        A pooled psycopg2 connection instance.
+    """
+    conn_pool = _get_pool()
+    conn = conn_pool.getconn()
+    try:
+        yield conn
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        conn_pool.putconn(conn, close=bool(conn.closed))
+
+
+def execute_batch_insert(insert_sql: str, data: List[Tuple],
+                         page_size: int = DEFAULT_PAGE_SIZE, template: Optional[str] = None) -> int:
     """
     Execute a batch INSERT/UPSERT using psycopg2.extras.execute_values.
 
     Args:
         insert_sql: SQL statement with a single VALUES %s placeholder for execute_values.
         data: List of tuples to insert.
+        page_size: Maximum number of rows sent per statement (one round-trip each).
+        template: Optional per-row template, e.g. "(%s,%s,%s)".
 
     Returns:
         Number of affected rows (int).
@@ -38,25 +102,63 @@ def execute_batch_insert(insert_sql: str, data: List[Tuple]) -> int:
         logger.debug("No data to insert, skipping execute_batch_insert")
         return 0
 
-    conn = None
-    cur = None
     try:
-        conn = get_db_connection()
-        conn.autocommit = False
-        cur = conn.cursor()
-        extras.execute_values(cur, insert_sql, data)
-        conn.commit()
-        logger.info(f"Inserted/Updated {cur.rowcount} rows")
-        return cur.rowcount
+        with borrow_conn() as conn:
+            with conn.cursor() as cur:
+                extras.execute_values(cur, insert_sql, data, template=template, page_size=page_size)
+                conn.commit()
+                logger.info(f"Inserted/Updated {cur.rowcount} rows")
+                return cur.rowcount
 
     except Exception:
         logger.exception("Error inserting batch into database")
-        if conn:
-            conn.rollback()
         raise
 
-    finally:
-        if cur:
-            cur.close()
-        if conn:
-            conn.close()
+
+def execute_copy_upsert(table: str, columns: Sequence[str], merge_sql: str, data: List[Tuple],
+                        force_not_null: Sequence[str] = ()) -> int:
+    """
+    Bulk-load rows with COPY into a temporary staging table, then merge them into
+    the target table with a single INSERT ... SELECT ... ON CONFLICT statement.
+
+    COPY streams all rows in one go, avoiding the per-row parameter handling of
+    INSERT ... VALUES; conflict resolution happens server-side during the merge.
+
+    Args:
+        table: Target table name. The staging table `<table>_staging` is created with
+            the same structure and dropped at commit.
+        columns: Columns present in each data tuple, in order.
+        merge_sql: INSERT ... SELECT ... FROM <table>_staging ... statement.
+        data: List of tuples to load.
+        force_not_null: Text columns whose empty values must load as '' instead of NULL.
+            The CSV writer emits '' as an empty unquoted field, which COPY otherwise reads
+            as NULL and rejects on NOT NULL columns.
+
+    Returns:
+        Number of affected rows (int).
+    """
+    if not data:
+        logger.debug("No data to load, skipping execute_copy_upsert")
+        return 0
+
+    buf = io.StringIO()
+    csv.writer(buf).writerows(data)
+    buf.seek(0)
+
+    staging = f"{table}_staging"
+    try:
+        with borrow_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+                options = "FORMAT csv"
+                if force_not_null:
+                    options += f", FORCE_NOT_NULL ({', '.join(force_not_null)})"
+                cur.copy_expert(f"COPY {staging} ({', '.join(columns)}) FROM STDIN WITH ({options})", buf)
+                cur.execute(merge_sql)
+                conn.commit()
+                logger.info(f"Inserted/Updated {cur.rowcount} rows")
+                return cur.rowcount
+
+    except Exception:
+        logger.exception("Error copying batch into database")
+        raise
@@ -2,31 +2,88 @@
 Propositions data extraction utilities.
 """
 
+import orjson
 import pandas as pd
+from pathlib import Path
 from .config import PROPOSITIONS_JSON
 from .utils import generate_word_cloud
 from .repository import insert_word_clouds_batch
 
 import logging
-from typing import List, Tuple, Dict, Any
+from itertools import chain
+from typing import Iterator, List, Set, Tuple, Any
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are streamed with ijson (when installed) instead of parsed at once
+STREAMING_MIN_BYTES = 256 * 1024 * 1024
+
+# Propositions normalized per DataFrame chunk when streaming
+JSON_CHUNK_SIZE = 10000
+
+# Word cloud rows accumulated before each batch insert
+WORD_CLOUD_FLUSH_ROWS = 5000
+
+
+def _iter_proposition_chunks(propositions_json_path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Stream the `proposicoes` array with ijson and yield it as normalized DataFrame chunks.
+
+    Args:
+        propositions_json_path: Path to the JSON file containing the propositions object.
+        chunk_size: Number of propositions per chunk.
 
-def load_propositions_dataset(propositions_json_path: str = PROPOSITIONS_JSON) -> Tuple[pd.Series, pd.DataFrame, pd.DataFrame]:
+    Yields:
+        DataFrames with up to `chunk_size` propositions each.
+    """
+    with open(propositions_json_path, "rb") as f:
+        batch: List[dict] = []
+        for item in ijson.items(f, "proposicoes.item", use_float=True):
+            batch.append(item)
+            if len(batch) >= chunk_size:
+                yield pd.json_normalize(batch)
+                batch = []
+        if batch:
+            yield pd.json_normalize(batch)
+
+
+def load_propositions_dataset(propositions_json_path: str = PROPOSITIONS_JSON,
+                              chunk_size: int = JSON_CHUNK_SIZE) -> pd.DataFrame:
     """
-    Load propositions JSON and return authors series, filtered dataframe and full dataframe.
+    Load propositions JSON into a single DataFrame.
+
+    Regular files are parsed straight into a list of dicts and normalized once, so no
+    intermediate DataFrame (or filtered column copy) is kept in memory. Files of at least
+    STREAMING_MIN_BYTES are streamed with ijson, when available, and normalized in chunks
+    of `chunk_size` propositions, so the whole parsed JSON is never held at once. The
+    low-cardinality `descricaoTipo` column is stored as a categorical.
 
     Args:
         propositions_json_path: Path to the JSON file containing the propositions object.
+        chunk_size: Number of propositions normalized per chunk when streaming.
 
     Returns:
-        Tuple containing (df_authors, df_propositions_filtered, df_propositions).
+        DataFrame with one row per proposition.
     """
-    df_propositions = pd.json_normalize(pd.read_json(propositions_json_path)["proposicoes"])
-    df_authors = df_propositions["autores"]
-    df_propositions_filtered = df_propositions.loc[:, ["id", "descricaoTipo", "dataApresentacao", "urlInteiroTeor", "autores"]]
-    return df_authors, df_propositions_filtered, df_propositions
+    path = Path(propositions_json_path)
+    if ijson is not None and path.stat().st_size >= STREAMING_MIN_BYTES:
+        logger.info("Streaming propositions from %s in chunks of %d", path, chunk_size)
+        chunks = list(_iter_proposition_chunks(path, chunk_size))
+        df_propositions = pd.concat(chunks, ignore_index=True, copy=False) if chunks else pd.DataFrame()
+        del chunks
+    else:
+        data = orjson.loads(path.read_bytes())["proposicoes"]
+        df_propositions = pd.json_normalize(data)
+        del data
+
+    if "descricaoTipo" in df_propositions:
+        df_propositions["descricaoTipo"] = df_propositions["descricaoTipo"].astype("category")
+    return df_propositions
 
 
 def extract_unique_authors(df_authors: pd.Series) -> List[Tuple[int, str, str, str]]:
@@ -39,67 +96,77 @@ def extract_unique_authors(df_authors: pd.Series) -> List[Tuple[int, str, str, s
     Returns:
         List of tuples (idDeputadoAutor, nomeAutor, siglaPartidoAutor, siglaUFAutor).
     """
-    authors_added: Dict[int, int] = {}
-    authors: List[Tuple[int, str, str, str]] = []
-    for i in range(0, df_authors.size):
-        for j in range(0, len(df_authors.iloc[i])):
-            idep = df_authors.iloc[i][j].get("idDeputadoAutor")
-            name = df_authors.iloc[i][j].get("nomeAutor")
-            party = df_authors.iloc[i][j].get("siglaPartidoAutor")
-            uf = df_authors.iloc[i][j].get("siglaUFAutor")
-
-            if idep and idep not in authors_added:
-                authors_added[idep] = 1
-                authors.append((idep, name, party, uf))
-
-    return authors
-
-
-def extract_propositions(df_propositions_filtered: pd.DataFrame) -> List[Tuple[int, str, str, Any, List[int]]]:
+    flat = pd.json_normalize(list(chain.from_iterable(df_authors.tolist())))
+    if flat.empty or "idDeputadoAutor" not in flat:
+        return []
+
+    # Hash-based dedup in pandas; keeps the first occurrence of each author
+    flat = flat.reindex(columns=["idDeputadoAutor", "nomeAutor", "siglaPartidoAutor", "siglaUFAutor"])
+    flat = flat[flat["idDeputadoAutor"].notna()]
+    flat = flat.drop_duplicates("idDeputadoAutor", keep="first")
+    # Missing values become None so they are sent to the database as NULL
+    flat = flat.astype(object).where(flat.notna(), None)
+
+    return list(zip(
+        flat["idDeputadoAutor"].astype(int).tolist(),
+        flat["nomeAutor"].tolist(),
+        flat["siglaPartidoAutor"].tolist(),
+        flat["siglaUFAutor"].tolist(),
+    ))
+
+
+def extract_propositions(df_propositions: pd.DataFrame) -> List[Tuple[int, str, str, Any, List[int]]]:
     """
-    Build a list of propositions from a filtered DataFrame.
+    Build a list of propositions from the propositions DataFrame.
 
     Args:
-        df_propositions_filtered: DataFrame with columns id, descricaoTipo, dataApresentacao, urlInteiroTeor, autores
+        df_propositions: DataFrame with (at least) columns id, descricaoTipo, dataApresentacao, urlInteiroTeor, autores
 
     Returns:
         List of proposition tuples: (id, url_inteiro_teor, descricao_tipo, data_apresentacao, authors_ids)
     """
     propositions: List[Tuple[int, str, str, Any, List[int]]] = []
 
-    for i in range(0, df_propositions_filtered["id"].size):
-        idp = int(df_propositions_filtered.iloc[i]["id"])
-        url = df_propositions_filtered.iloc[i]["urlInteiroTeor"]
-        ptype = df_propositions_filtered.iloc[i]["descricaoTipo"]
-        sub_date = df_propositions_filtered.iloc[i]["dataApresentacao"]
-
+    columns = ["id", "urlInteiroTeor", "descricaoTipo", "dataApresentacao", "autores"]
+    for idp, url, ptype, sub_date, autores in df_propositions[columns].itertuples(index=False, name=None):
         authors: List[int] = []
-        authors_added: Dict[int, int] = {}
+        authors_added: Set[int] = set()
 
-        for j in range(0, len(df_propositions_filtered.iloc[i]["autores"])):
-            idep = df_propositions_filtered.iloc[i]["autores"][j].get("idDeputadoAutor")
+        for author in autores:
+            idep = author.get("idDeputadoAutor")
 
-            if idep and idep not in authors_added:
-                authors_added[idep] = 1
+            if idep is not None and idep not in authors_added:
+                authors_added.add(idep)
                 authors.append(idep)
 
-        propositions.append((idp, url, ptype, sub_date, authors))
+        propositions.append((int(idp), url, ptype, sub_date, authors))
 
     return propositions
 
 
-def generate_and_insert_word_clouds(df_propositions: pd.DataFrame) -> None:
+def generate_and_insert_word_clouds(df_propositions: pd.DataFrame, flush_rows: int = WORD_CLOUD_FLUSH_ROWS) -> None:
     """
     Generate and insert word clouds for each proposition in the dataframe.
 
     The dataframe is expected to contain columns `id` and `textoInteiroTeorLimpo`.
+    Rows are accumulated and written in batches of roughly `flush_rows` rows
+    instead of one database call per proposition.
 
     Args:
         df_propositions: DataFrame with proposition data.
+        flush_rows: Number of accumulated rows that triggers a batch insert.
     """
-    for i in range(0, df_propositions["id"].size):
-        idp = df_propositions.iloc[i]["id"]
-        text = df_propositions.iloc[i].get("textoInteiroTeorLimpo", "")
-        word_cloud_to_insert = generate_word_cloud(idp, text)
-        insert_word_clouds_batch(word_cloud_to_insert)
-        logger.debug("Inserted word cloud for id %s", idp)
+    if "textoInteiroTeorLimpo" in df_propositions:
+        texts = df_propositions["textoInteiroTeorLimpo"].fillna("").to_numpy()
+    else:
+        texts = [""] * len(df_propositions)
+
+    rows: List[Tuple[int, str, int]] = []
+    for idp, text in zip(df_propositions["id"].to_numpy(), texts):
+        rows.extend(generate_word_cloud(idp, text))
+        if len(rows) >= flush_rows:
+            insert_word_clouds_batch(rows)
+            rows = []
+
+    if rows:
+        insert_word_clouds_batch(rows)
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import sqlite3
+import threading
+from typing import Any, Dict, Optional, Type
+from openai import APIConnectionError, APIStatusError
+from pydantic import BaseModel
+from .config import LLM_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Attempts per LLM call on transient errors, and the cap (seconds) of the backoff between them
+LLM_MAX_ATTEMPTS = 5
+LLM_MAX_BACKOFF = 30
+# HTTP statuses worth retrying besides 5xx: request timeout, conflict and rate limit
+LLM_RETRY_STATUSES = {408, 409, 429}
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
+
+def _get_cache_conn() -> Optional[sqlite3.Connection]:
+    """
+    Lazily open the shared sqlite cache connection and create its table.
+
+    Returns:
+        The process-wide sqlite3 connection, or None when caching is disabled.
+    """
+    global _conn
+    if not LLM_CACHE_PATH:
+        return None
+    if _conn is None:
+        with _conn_lock:
+            if _conn is None:
+                conn = sqlite3.connect(LLM_CACHE_PATH, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+                conn.commit()
+                _conn = conn
+    return _conn
+
+
+def _cache_key(model: str, input: Any, text_format: Type[BaseModel], params: Dict[str, Any]) -> str:
+    """
+    Build a deterministic key for an LLM request.
+
+    Args:
+        model: Model name.
+        input: Request input messages.
+        text_format: Pydantic model used as the structured output schema.
+        params: Any extra request parameters.
+
+    Returns:
+        Hex-encoded sha256 digest of the request.
+    """
+    payload = json.dumps(
+        {"model": model, "input": input, "schema": text_format.model_json_schema(), "params": params},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def cached_parse(client: Any, model: str, input: Any, text_format: Type[BaseModel], **kwargs: Any) -> Dict[str, Any]:
+    """
+    Call `client.responses.parse` and return the parsed output, reusing cached responses.
+
+    Identical requests (same model, input, schema and parameters) are answered from an
+    on-disk sqlite cache, so re-runs of the pipeline do not pay for the same LLM call twice.
+    Only successful responses are stored, and requests with a non-zero temperature bypass the cache.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        model: Model name.
+        input: Request input messages.
+        text_format: Pydantic model used as the structured output schema.
+        **kwargs: Extra parameters forwarded to `client.responses.parse`.
+
+    Returns:
+        The parsed structured output as a dict.
+    """
+    conn = _get_cache_conn()
+    if conn is None or kwargs.get("temperature"):
+        return await _parse(client, model, input, text_format, **kwargs)
+
+    key = _cache_key(model, input, text_format, kwargs)
+    with _conn_lock:
+        row = conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+    if row is not None:
+        logger.debug("LLM cache hit for key %s", key)
+        return json.loads(row[0])
+
+    parsed = await _parse(client, model, input, text_format, **kwargs)
+    with _conn_lock:
+        conn.execute("INSERT OR REPLACE INTO llm_cache (key, response) VALUES (?, ?)",
+                     (key, json.dumps(parsed, ensure_ascii=False)))
+        conn.commit()
+    return parsed
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """
+    Tell whether an OpenAI error is transient, mirroring the SDK's own retry policy.
+
+    Returns:
+        True for connection errors/timeouts, 408, 409, 429 and 5xx responses.
+    """
+    if isinstance(exc, APIConnectionError):
+        return True
+    return isinstance(exc, APIStatusError) and (exc.status_code >= 500 or exc.status_code in LLM_RETRY_STATUSES)
+
+
+async def _parse(client: Any, model: str, input: Any, text_format: Type[BaseModel], **kwargs: Any) -> Dict[str, Any]:
+    """
+    Call the LLM and extract the parsed structured output.
+
+    Transient errors (connection failures, timeouts, 408, 409, 429 and 5xx) are retried
+    with exponential backoff plus jitter; any other error, or the last transient one,
+    is raised to the caller.
+
+    Returns:
+        The parsed structured output as a dict.
+    """
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        try:
+            response = await client.responses.parse(model=model, input=input, text_format=text_format, **kwargs)
+            break
+        except (APIConnectionError, APIStatusError) as exc:
+            if attempt == LLM_MAX_ATTEMPTS - 1 or not _is_retryable(exc):
+                raise
+            delay = min(LLM_MAX_BACKOFF, 2 ** attempt + random.random())
+            logger.warning("LLM call failed (%s), retrying in %.1fs", type(exc).__name__, delay)
+            await asyncio.sleep(delay)
+    # Only the parsed model is converted; serializing the whole response with to_dict() is wasted work
+    return response.output_parsed.model_dump()
@@ -1,23 +1,57 @@
 import logging
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from .config import OPENAI_API_KEY
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by every request made through one client; keep-alive connections
+# are reused across both LLM stages so TLS handshakes are paid once per connection.
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
 
-def create_openai_client(api_key: Optional[str] = None) -> OpenAI:
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """
+    Return the provided API key or the one from config, failing if neither is set.
+    """
+    key = api_key or OPENAI_API_KEY
+    if not key:
+        logger.error("OPENAI_API_KEY is not set. Set it in .env or pass as parameter.")
+        raise RuntimeError("OPENAI_API_KEY is not set")
+    return key
+
+
+def create_openai_client(api_key: Optional[str] = None,
+                         http_client: Optional[httpx.Client] = None) -> OpenAI:
     """
     Create and return an OpenAI client using the provided API key or the one from config.
 
     Args:
         api_key: Optional API key string. If omitted, uses OPENAI_API_KEY from config.
+        http_client: Optional httpx client to share; defaults to one bounded by HTTP_LIMITS.
 
     Returns:
         An OpenAI client instance.
     """
-    key = api_key or OPENAI_API_KEY
-    if not key:
-        logger.error("OPENAI_API_KEY is not set. Set it in .env or pass as parameter.")
-        raise RuntimeError("OPENAI_API_KEY is not set")
-    return OpenAI(api_key=key)
+    return OpenAI(api_key=_resolve_api_key(api_key),
+                  http_client=http_client or DefaultHttpxClient(limits=HTTP_LIMITS))
+
+
+def create_async_openai_client(api_key: Optional[str] = None,
+                               http_client: Optional[httpx.AsyncClient] = None) -> AsyncOpenAI:
+    """
+    Create and return an asyncio OpenAI client using the provided API key or the one from config.
+
+    Args:
+        api_key: Optional API key string. If omitted, uses OPENAI_API_KEY from config.
+        http_client: Optional httpx async client to share; defaults to one bounded by HTTP_LIMITS.
+
+    Returns:
+        An AsyncOpenAI client instance with the SDK's own retries disabled.
+    """
+    # Retries of transient errors (connection, 408/409/429, 5xx) are done by llm_cache with its own
+    # backoff; letting the SDK retry as well would multiply the attempts per call.
+    return AsyncOpenAI(api_key=_resolve_api_key(api_key),
+                       http_client=http_client or DefaultAsyncHttpxClient(limits=HTTP_LIMITS),
+                       max_retries=0)
@@ -1,13 +1,13 @@
 import logging
-from typing import List, Tuple, Optional
-from .db import execute_batch_insert, get_db_connection
+from typing import List, Set, Tuple, Optional
+from .db import DEFAULT_PAGE_SIZE, borrow_conn, execute_batch_insert, execute_copy_upsert
 import psycopg2.extras
 
 logger = logging.getLogger(__name__)
 
 UPSERT_PROPOSITION_WORD_CLOUD = """
-    INSERT INTO proposition_word_cloud (id, word, frequency) 
-    VALUES %s
+    INSERT INTO proposition_word_cloud (id, word, frequency)
+    SELECT DISTINCT ON (id, word) id, word, frequency FROM proposition_word_cloud_staging
     ON CONFLICT (id, word) DO UPDATE SET frequency = EXCLUDED.frequency
 """
 
@@ -22,8 +22,8 @@ UPSERT_PROPOSITION_SUMMARY = """
 """
 
 UPSERT_PROPOSITION_NER = """
-    INSERT INTO proposition_ner (id, entity_type, entity) 
-    VALUES %s
+    INSERT INTO proposition_ner (id, entity_type, entity)
+    SELECT id, entity_type, entity FROM proposition_ner_staging
     ON CONFLICT (id, entity_type, entity) DO NOTHING
 """
 
@@ -58,7 +58,8 @@ def insert_word_clouds_batch(data: List[Tuple[int, str, int]]) -> int:
         Number of affected rows.
     """
     logger.debug(f"Inserting word cloud batch of size: {len(data)}")
-    return execute_batch_insert(UPSERT_PROPOSITION_WORD_CLOUD, data)
+    return execute_copy_upsert("proposition_word_cloud", ("id", "word", "frequency"),
+                               UPSERT_PROPOSITION_WORD_CLOUD, data, force_not_null=("word",))
 
 
 def insert_proposition_summaries_batch(data: List[Tuple[int, str, str, str, str]]) -> int:
@@ -72,7 +73,7 @@ def insert_proposition_summaries_batch(data: List[Tuple[int, str, str, str, str]
         Number of affected rows.
     """
     logger.debug(f"Inserting summaries batch of size: {len(data)}")
-    return execute_batch_insert(UPSERT_PROPOSITION_SUMMARY, data)
+    return execute_batch_insert(UPSERT_PROPOSITION_SUMMARY, data, template="(%s,%s,%s,%s,%s)")
 
 
 def insert_proposition_entities_batch(data: List[Tuple[int, str, str]]) -> int:
@@ -86,7 +87,8 @@ def insert_proposition_entities_batch(data: List[Tuple[int, str, str]]) -> int:
         Number of affected rows.
     """
     logger.debug(f"Inserting entities batch of size: {len(data)}")
-    return execute_batch_insert(UPSERT_PROPOSITION_NER, data)
+    return execute_copy_upsert("proposition_ner", ("id", "entity_type", "entity"),
+                               UPSERT_PROPOSITION_NER, data, force_not_null=("entity_type", "entity"))
 
 
 def insert_authors_batch(data: List[Tuple[int, str, str, str]]) -> int:
@@ -100,7 +102,7 @@ def insert_authors_batch(data: List[Tuple[int, str, str, str]]) -> int:
         Number of affected rows.
     """
     logger.debug(f"Inserting authors batch of size: {len(data)}")
-    return execute_batch_insert(UPSERT_AUTHORS, data)
+    return execute_batch_insert(UPSERT_AUTHORS, data, template="(%s,%s,%s,%s)")
 
 
 def insert_proposition_topics_batch(rows: List[Tuple[int, str, float]]) -> None:
@@ -113,18 +115,15 @@ def insert_proposition_topics_batch(rows: List[Tuple[int, str, float]]) -> None:
     if not rows:
         return
 
-    conn = get_db_connection()
     try:
-        with conn:
+        with borrow_conn() as conn, conn:
             with conn.cursor() as cur:
                 psycopg2.extras.execute_values(
-                    cur, UPSERT_PROPOSITION_TOPICS, 
-                    rows, template=None, page_size=100)
+                    cur, UPSERT_PROPOSITION_TOPICS,
+                    rows, template="(%s,%s)", page_size=DEFAULT_PAGE_SIZE)
     except Exception as exc:
         logger.exception("Failed to insert proposition topics batch: %s", exc)
         raise
-    finally:
-        conn.close()
 
 
 def insert_propositions_batch(data: List[Tuple[int, str, str, str, List[int]]]) -> int:
@@ -138,7 +137,7 @@ def insert_propositions_batch(data: List[Tuple[int, str, str, str, List[int]]])
         Number of affected rows.
     """
     logger.debug(f"Inserting propositions batch of size: {len(data)}")
-    return execute_batch_insert(UPSERT_PROPOSITIONS, data)
+    return execute_batch_insert(UPSERT_PROPOSITIONS, data, template="(%s,%s,%s,%s,%s)")
 
 
 def fetch_propositions_for_classification(limit: Optional[int] = None) -> List[Tuple[int, str]]:
@@ -160,9 +159,8 @@ def fetch_propositions_for_classification(limit: Optional[int] = None) -> List[T
         sql += " LIMIT %s"
         params = (limit,)
 
-    conn = get_db_connection()
     try:
-        with conn:
+        with borrow_conn() as conn, conn:
             with conn.cursor() as cur:
                 cur.execute(sql, params)
                 rows = cur.fetchall()
@@ -170,5 +168,47 @@ def fetch_propositions_for_classification(limit: Optional[int] = None) -> List[T
     except Exception as exc:
         logger.exception("Failed to fetch propositions for classification: %s", exc)
         raise
-    finally:
-        conn.close()
+
+
+def _fetch_ids(sql: str) -> Set[int]:
+    """
+    Run a query returning a single id column and collect the ids into a set.
+
+    Args:
+        sql: SELECT statement whose first column is the proposition id.
+
+    Returns:
+        Set of proposition ids.
+    """
+    with borrow_conn() as conn, conn:
+        with conn.cursor() as cur:
+            cur.execute(sql)
+            return {int(r[0]) for r in cur.fetchall()}
+
+
+def fetch_existing_summary_ids() -> Set[int]:
+    """
+    Fetch the ids of propositions that already have a summary stored.
+
+    Returns:
+        Set of proposition ids present in `proposition_summary`.
+    """
+    try:
+        return _fetch_ids("SELECT id FROM proposition_summary")
+    except Exception as exc:
+        logger.exception("Failed to fetch existing summary ids: %s", exc)
+        raise
+
+
+def fetch_existing_topic_ids() -> Set[int]:
+    """
+    Fetch the ids of propositions that already have a topic stored.
+
+    Returns:
+        Set of proposition ids present in `proposition_topics`.
+    """
+    try:
+        return _fetch_ids("SELECT id FROM proposition_topics")
+    except Exception as exc:
+        logger.exception("Failed to fetch existing topic ids: %s", exc)
+        raise
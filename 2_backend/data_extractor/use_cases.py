@@ -1,12 +1,41 @@
+import asyncio
+import hashlib
+import inspect
+import json
 import time
 import logging
-from typing import List, Tuple, Any, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Tuple, Any, Optional, Type
 from pydantic import BaseModel
-from .repository import insert_proposition_summaries_batch, insert_proposition_entities_batch, insert_proposition_topics_batch
-import concurrent.futures
+from .llm_cache import cached_parse
+from .repository import (
+    insert_proposition_summaries_batch,
+    insert_proposition_entities_batch,
+    insert_proposition_topics_batch,
+    fetch_existing_summary_ids,
+    fetch_existing_topic_ids,
+)
 
 logger = logging.getLogger(__name__)
 
+LLM_MODEL = "gpt-5-nano"
+
+# Longest proposition text (in characters) embedded in a prompt; longer texts keep their head and tail
+LLM_MAX_INPUT_CHARS = 24000
+
+# Maximum number of LLM requests in flight at the same time
+DEFAULT_MAX_CONCURRENCY = 50
+
+# Number of processed propositions buffered before their rows are written to the database
+INSERT_FLUSH_SIZE = 100
+
+# Rows written per insert when loading Batch API results, and seconds between status polls
+BATCH_INSERT_SIZE = 500
+BATCH_POLL_INTERVAL = 60
+
+# Batch API limits per input file (requests and bytes); larger jobs are split into several batches
+BATCH_MAX_REQUESTS = 50000
+BATCH_MAX_BYTES = 190 * 1024 * 1024
+
 
 class ResponseSchema(BaseModel):
     """
@@ -32,7 +61,150 @@ class ResponseSchema(BaseModel):
         }
 
 
-def generate_proposition_summary_and_entities(client: Any, proposition_id: int, full_text: str) -> Tuple[List[Tuple], List[Tuple]]:
+def _truncate_for_llm(text: str, max_chars: int = LLM_MAX_INPUT_CHARS) -> str:
+    """
+    Bound the text sent to the LLM, keeping its beginning and end.
+
+    Args:
+        text: Proposition text.
+        max_chars: Maximum number of characters kept from the text.
+
+    Returns:
+        The text itself if short enough, otherwise its first and last `max_chars // 2`
+        characters joined by a truncation marker.
+    """
+    text = text or ""
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    return text[:half] + "\n...[truncated]...\n" + text[-half:]
+
+
+def _summary_input(full_text: str) -> List[dict]:
+    """
+    Build the LLM input messages for the summary/NER task.
+    """
+    return [
+        {"role": "developer", "content":
+         """
+         Você é um chatbot especialista em processamento de linguagem natural.
+        
+         Regras:
+         1. O tema principal deve ser representado em no máximo 10 palavras.
+         2. O resumo do texto deve ter no máximo 50 palavras.
+         3. Cada item de entities é um par com tipo da entidade nomeada e seu valor, por exemplo: 
+             - ['data', '06 de nov. de 2025']
+         4. classifique o sentimento do texto em 7 nuances:
+             - extremamente-positivo, positivo, positivo-neutro, neutro, negativo-neutro, negativo, extremamente-negativo
+         5. classifique o em uma das 7 seguintes ideologias:
+             - extrema-esquerda, esquerda, centro-esquerda, centro, centro-direita, direita, extrema-direita
+        
+         Revise o conteúdo gerado e corrija se necessário.
+         """
+        },
+        {
+            "role": "user",
+            "content": [
+                {  
+                    "type": "input_text",  
+                    "text": f"""
+                        Execute a seguinte sequência de passos.
+                       
+                        1. Faça resumo do texto.
+                        2. Identifique o tema principal
+                        3. Faça um reconhecimento de entidades nomeadas (NER).
+                        4. Classifique o sentimento do texto.
+                        5. Classifique a ideologia do texto.
+                       
+                        texto: {_truncate_for_llm(full_text)}"""
+                },
+            ]
+        }
+    ]
+
+
+def _summary_rows(proposition_id: int, parsed: dict) -> Tuple[List[Tuple], List[Tuple]]:
+    """
+    Convert a parsed summary/NER response into (summaries_list, entities_list) rows.
+    """
+    summaries = [(
+        int(proposition_id),
+        parsed.get("text_summary"),
+        parsed.get("main_theme"),
+        parsed.get("sentiment"),
+        parsed.get("ideology"),
+    )]
+
+    entities = [
+        (int(proposition_id), entity[0], entity[1])
+        for entity in parsed.get("entities", [])
+    ]
+
+    return summaries, entities
+
+
+def _dedup_by_text(items: List[Tuple[int, str]]) -> Tuple[List[Tuple[int, str]], Dict[int, List[int]]]:
+    """
+    Collapse propositions with identical text so each distinct text is sent to the LLM once.
+
+    Args:
+        items: List of tuples (proposition_id, text).
+
+    Returns:
+        Tuple (unique_items, members) where unique_items keeps the first proposition of each
+        distinct text and members maps that proposition id to every id sharing the text.
+    """
+    first_by_digest: Dict[bytes, int] = {}
+    unique_items: List[Tuple[int, str]] = []
+    members: Dict[int, List[int]] = {}
+    for prop_id, text in items:
+        digest = hashlib.blake2b((text or "").encode("utf-8"), digest_size=16).digest()
+        first_id = first_by_digest.get(digest)
+        if first_id is None:
+            first_by_digest[digest] = prop_id
+            unique_items.append((prop_id, text))
+            members[prop_id] = [prop_id]
+        else:
+            members[first_id].append(prop_id)
+
+    if len(unique_items) < len(items):
+        logger.info("%d propositions share text with another one; sending %d distinct texts.",
+                    len(items) - len(unique_items), len(unique_items))
+    return unique_items, members
+
+
+def _require_async_client(client: Any) -> None:
+    """
+    Fail fast when a synchronous OpenAI client is given to the asyncio LLM functions.
+
+    Otherwise every call would fail on `await` and only be logged per proposition.
+    """
+    if not inspect.iscoroutinefunction(client.responses.parse):
+        raise TypeError(f"An AsyncOpenAI client is required (see create_async_openai_client), "
+                        f"got {type(client).__name__}")
+
+
+async def _run_bounded(items: List[Tuple[int, str]],
+                       worker: Callable[[int, str], Awaitable[Any]],
+                       max_concurrency: int) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Run `worker(prop_id, text)` for every item with at most `max_concurrency` calls in flight.
+
+    Yields:
+        Tuples (prop_id, result) in completion order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(prop_id: int, text: str) -> Tuple[int, Any]:
+        async with semaphore:
+            return prop_id, await worker(prop_id, text)
+
+    tasks = [asyncio.ensure_future(bounded(prop_id, text)) for prop_id, text in items]
+    for fut in asyncio.as_completed(tasks):
+        yield await fut
+
+
+async def generate_proposition_summary_and_entities(client: Any, proposition_id: int, full_text: str) -> Tuple[List[Tuple], List[Tuple]]:
     """
     Call the LLM to generate a summary and named entities for a single proposition.
 
@@ -40,114 +212,116 @@ def generate_proposition_summary_and_entities(client: Any, proposition_id: int,
     """
     try:
         start = time.time()
-        response = client.responses.parse(
-            model="gpt-5-nano",
-            input=[
-                {"role": "developer", "content":
-                 """
-                 Você é um chatbot especialista em processamento de linguagem natural.
-                
-                 Regras:
-                 1. O tema principal deve ser representado em no máximo 10 palavras.
-                 2. O resumo do texto deve ter no máximo 50 palavras.
-                 3. Cada item de entities é um par com tipo da entidade nomeada e seu valor, por exemplo: 
-                     - ['data', '06 de nov. de 2025']
-                 4. classifique o sentimento do texto em 7 nuances:
-                     - extremamente-positivo, positivo, positivo-neutro, neutro, negativo-neutro, negativo, extremamente-negativo
-                 5. classifique o em uma das 7 seguintes ideologias:
-                     - extrema-esquerda, esquerda, centro-esquerda, centro, centro-direita, direita, extrema-direita
-                
-                 Revise o conteúdo gerado e corrija se necessário.
-                 """
-                },
-                {
-                    "role": "user",
-                    "content": [
-                        {  
-                            "type": "input_text",  
-                            "text": f"""
-                                Execute a seguinte sequência de passos.
-                               
-                                1. Faça resumo do texto.
-                                2. Identifique o tema principal
-                                3. Faça um reconhecimento de entidades nomeadas (NER).
-                                4. Classifique o sentimento do texto.
-                                5. Classifique a ideologia do texto.
-                               
-                                texto: {full_text}
-                            """
-                        },
-                    ]
-                }
-            ],
+        parsed = await cached_parse(
+            client,
+            model=LLM_MODEL,
+            input=_summary_input(full_text),
             text_format=ResponseSchema
         )
 
         logger.info("API call for ID %d took: %.2fs", proposition_id, time.time() - start)
 
-        parsed = response.to_dict().get("output")[1].get("content")[0].get("parsed")
-
-        summaries = [(
-            int(proposition_id),
-            parsed.get("text_summary"),
-            parsed.get("main_theme"),
-            parsed.get("sentiment"),
-            parsed.get("ideology"),
-        )]
-
-        entities = [
-            (int(proposition_id), entity[0], entity[1])
-            for entity in parsed.get("entities", [])
-        ]
-
-        return summaries, entities
+        return _summary_rows(proposition_id, parsed)
 
     except Exception:
         logger.exception("Error processing proposition id %d", proposition_id)
         return [], []
 
 
-def process_propositions_in_parallel(client: Any, df_propositions: Any, max_workers: int = 10) -> None:
+async def process_propositions_async(client: Any, df_propositions: Any,
+                                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                                     flush_every: int = INSERT_FLUSH_SIZE, skip_existing: bool = True) -> None:
     """
-    Process a batch of propositions in parallel using threads to call the LLM.
+    Process a batch of propositions concurrently on the event loop, calling the LLM.
+
+    Results are consumed as they complete and written to the database every
+    `flush_every` processed propositions, so a slow LLM call does not hold back
+    the inserts of the ones already finished.
 
     Args:
-        client: OpenAI client instance.
+        client: AsyncOpenAI client instance.
         df_propositions: DataFrame with propositions and text column `textoInteiroTeorLimpo`.
-        max_workers: Number of thread workers.
+        max_concurrency: Maximum number of LLM requests in flight.
+        flush_every: Number of processed propositions buffered before each insert.
+        skip_existing: If True, propositions that already have a stored summary are not sent to the LLM.
     """
 
-    all_summaries = []
-    all_entities = []
+    _require_async_client(client)
+
+    summaries_buffer = []
+    entities_buffer = []
     new_processed_ids = set()
 
+    async def flush() -> None:
+        # psycopg2 blocks, so inserts run in a worker thread to keep in-flight requests moving
+        if summaries_buffer:
+            logger.info(f"Inserting {len(summaries_buffer)} summaries into the database...")
+            await asyncio.to_thread(insert_proposition_summaries_batch, list(summaries_buffer))
+            summaries_buffer.clear()
+        if entities_buffer:
+            logger.info(f"Inserting {len(entities_buffer)} entities into the database...")
+            await asyncio.to_thread(insert_proposition_entities_batch, list(entities_buffer))
+            entities_buffer.clear()
+
     ids = df_propositions['id'].tolist()
-    texts = df_propositions['textoInteiroTeorLimpo'].tolist()
+    texts = df_propositions['textoInteiroTeorLimpo'].fillna('').tolist()
+
+    # Propositions without text would all share one dedup group and get the same invented answer
+    with_text = [(prop_id, text) for prop_id, text in zip(ids, texts) if text.strip()]
+    if len(with_text) < len(ids):
+        logger.warning("Skipping %d propositions without text.", len(ids) - len(with_text))
+
+    existing = fetch_existing_summary_ids() if skip_existing else set()
+    todo = [(prop_id, text) for prop_id, text in with_text if prop_id not in existing]
+    logger.info("Skipping %d already summarized propositions; %d to process.", len(with_text) - len(todo), len(todo))
+
+    unique_todo, members = _dedup_by_text(todo)
+
+    async def worker(prop_id: int, text: str) -> Tuple[List[Tuple], List[Tuple]]:
+        return await generate_proposition_summary_and_entities(client, prop_id, text)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        results = executor.map(lambda args: generate_proposition_summary_and_entities(client, *args), zip(ids, texts))
+    pending = 0
+    async for current_id, (summaries, entities) in _run_bounded(unique_todo, worker, max_concurrency):
+        if not summaries and not entities:
+            logger.warning("Failed to process proposition id: %d", current_id)
+            continue
 
-        for i, (summaries, entities) in enumerate(results):
-            current_id = ids[i]
-            if summaries and entities:
-                all_summaries.extend(summaries)
-                all_entities.extend(entities)
-                new_processed_ids.add(current_id)
-                logger.debug("Processed index %d, id %d", i, current_id)
-            else:
-                logger.warning("Failed to process proposition id: %d", current_id)
+        # Fan the single LLM answer out to every proposition sharing the same text
+        for member_id in members[current_id]:
+            # A proposition without named entities still has a valid summary
+            if summaries:
+                summaries_buffer.extend((int(member_id), *row[1:]) for row in summaries)
+            if entities:
+                entities_buffer.extend((int(member_id), *row[1:]) for row in entities)
+            new_processed_ids.add(member_id)
+            logger.debug("Processed id %d", member_id)
+            pending += 1
 
-    if all_summaries:
-        logger.info(f"Inserting {len(all_summaries)} summaries into the database...")
-        insert_proposition_summaries_batch(all_summaries)
+        if pending >= flush_every:
+            await flush()
+            pending = 0
 
-    if all_entities:
-        logger.info(f"Inserting {len(all_entities)} entities into the database...")
-        insert_proposition_entities_batch(all_entities)
+    await flush()
 
     logger.info(f"Successfully processed and updated {len(new_processed_ids)} propositions.")
 
 
+def process_propositions_in_parallel(client: Any, df_propositions: Any,
+                                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                                     flush_every: int = INSERT_FLUSH_SIZE, skip_existing: bool = True) -> None:
+    """
+    Synchronous wrapper around `process_propositions_async` running its own event loop.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        df_propositions: DataFrame with propositions and text column `textoInteiroTeorLimpo`.
+        max_concurrency: Maximum number of LLM requests in flight.
+        flush_every: Number of processed propositions buffered before each insert.
+        skip_existing: If True, propositions that already have a stored summary are not sent to the LLM.
+    """
+    asyncio.run(process_propositions_async(client, df_propositions, max_concurrency, flush_every, skip_existing))
+
+
 class ResponseSchemaClassification(BaseModel):
     """
     Pydantic schema for the classification response returned by the LLM.
@@ -182,59 +356,85 @@ TOPICS: List[str] = [
     "Políticas para Povos Indígenas e Comunidades Tradicionais"
 ]
 
+# Pre-joined once so the static part of the classification prompt is byte-identical
+# across calls (the variable proposition text always goes last, after this prefix).
+_TOPICS_STR = ", ".join(TOPICS)
 
-def classify_and_store_proposition_topics(client: Any,
-                                         propositions: List[Tuple[int, str]],
-                                         max_workers: int = 8,
-                                         batch_insert: bool = True) -> None:
+# Static part of the classification user prompt; the proposition text is appended after it
+_CLASSIFY_PROMPT_PREFIX = f"""
+                        Classifique a proposição em exatamente um dos seguintes topicos. 
+            
+                        topicos: {_TOPICS_STR}
+
+                        proposição: """
+
+
+def _classification_input(text: str) -> List[dict]:
+    """
+    Build the LLM input messages for the topic classification task.
+    """
+    return [
+        {"role": "developer", "content":
+        """
+        Você é um chatbot especialista em processamento de linguagem natural.
+        """
+        },
+        {
+            "role": "user",
+            "content": [
+                {  
+                    "type": "input_text",  
+                    "text": _CLASSIFY_PROMPT_PREFIX + _truncate_for_llm(text)
+                },
+            ]
+        }
+    ]
+
+
+async def classify_and_store_proposition_topics_async(client: Any,
+                                                     propositions: List[Tuple[int, str]],
+                                                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                                                     batch_insert: bool = True,
+                                                     skip_existing: bool = True) -> None:
     """
-    Classify a list of propositions in parallel using the LLM and store results in the DB.
+    Classify a list of propositions concurrently using the LLM and store results in the DB.
 
     Args:
-        client: OpenAI client instance (expected to support client.responses.parse).
+        client: AsyncOpenAI client instance (expected to support client.responses.parse).
         propositions: List of tuples (proposition_id, full_text).
-        max_workers: Number of threads used for parallel classification.
+        max_concurrency: Maximum number of LLM requests in flight.
         batch_insert: If True, perform a single batch insert at the end; otherwise insert per item.
+        skip_existing: If True, propositions that already have a stored topic are not sent to the LLM.
     """
 
+    _require_async_client(client)
+
+    with_text = [(prop_id, text) for prop_id, text in propositions if text and text.strip()]
+    if len(with_text) < len(propositions):
+        logger.warning("Skipping %d propositions without text.", len(propositions) - len(with_text))
+    propositions = with_text
+
+    if skip_existing:
+        existing = fetch_existing_topic_ids()
+        propositions = [(prop_id, text) for prop_id, text in propositions if prop_id not in existing]
+        logger.info("%d propositions left to classify after skipping existing topics.", len(propositions))
+
     rows: List[Tuple[int, str, float]] = []
 
-    def classify_one(proposition_id: int, text: str) -> Optional[Tuple[int, str]]:
+    async def classify_one(proposition_id: int, text: str) -> Optional[Tuple[int, str]]:
         """
         Call the LLM to classify a single proposition. Returns a tuple for DB insertion
         or None if classification failed.
         """
         try:
             # Provide the Pydantic model as the text_format so the API can validate/generate according to schema
-            response = client.responses.parse(
-                model="gpt-5-nano",
-                input=[
-                    {"role": "developer", "content":
-                    """
-                    Você é um chatbot especialista em processamento de linguagem natural.
-                    """
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {  
-                                "type": "input_text",  
-                                "text": f"""
-                                    Classifique a proposição em exatamente um dos seguintes topicos. 
-                        
-                                    topicos: {TOPICS}
-
-                                    proposição: {text}
-                                """
-                            },
-                        ]
-                    }
-                ],
+            parsed = await cached_parse(
+                client,
+                model=LLM_MODEL,
+                input=_classification_input(text),
                 text_format=ResponseSchemaClassification
             )
 
-            parsed = response.to_dict().get("output")[1].get("content")[0].get("parsed")
-
             topic = parsed.get("topic")
             logger.info("Classified ID %s as '%s'", proposition_id, topic)
             return int(proposition_id), topic
@@ -242,28 +442,225 @@ def classify_and_store_proposition_topics(client: Any,
             logger.exception("Error classifying proposition ID %s: %s", proposition_id, exc)
             return None
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_id = {
-            executor.submit(classify_one, prop_id, text): prop_id
-            for prop_id, text in propositions
-        }
-        for fut in concurrent.futures.as_completed(future_to_id):
-            pid = future_to_id[fut]
-            try:
-                result = fut.result()
-                if result:
-                    if batch_insert:
-                        rows.append(result)
-                    else:
-                        # insert immediately
-                        insert_proposition_topics_batch([result])
-                        logger.info("Inserted classified topic for ID %s", pid)
-            except Exception as exc:
-                logger.exception("Unhandled error when classifying ID %s: %s", pid, exc)
+    unique_propositions, members = _dedup_by_text(propositions)
+
+    async for pid, result in _run_bounded(unique_propositions, classify_one, max_concurrency):
+        try:
+            if result:
+                # Same text, same topic for every proposition sharing it
+                results = [(int(member_id), result[1]) for member_id in members[pid]]
+                if batch_insert:
+                    rows.extend(results)
+                else:
+                    # insert immediately
+                    await asyncio.to_thread(insert_proposition_topics_batch, results)
+                    logger.info("Inserted classified topic for ID %s", pid)
+        except Exception as exc:
+            logger.exception("Unhandled error when classifying ID %s: %s", pid, exc)
 
     if batch_insert and rows:
         try:
-            insert_proposition_topics_batch(rows)
+            await asyncio.to_thread(insert_proposition_topics_batch, rows)
             logger.info("Inserted %d classified proposition topics.", len(rows))
         except Exception:
             logger.exception("Failed to insert classified proposition topics batch.")
+
+
+def classify_and_store_proposition_topics(client: Any,
+                                         propositions: List[Tuple[int, str]],
+                                         max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                                         batch_insert: bool = True,
+                                         skip_existing: bool = True) -> None:
+    """
+    Synchronous wrapper around `classify_and_store_proposition_topics_async` running its own event loop.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        propositions: List of tuples (proposition_id, full_text).
+        max_concurrency: Maximum number of LLM requests in flight.
+        batch_insert: If True, perform a single batch insert at the end; otherwise insert per item.
+        skip_existing: If True, propositions that already have a stored topic are not sent to the LLM.
+    """
+    asyncio.run(classify_and_store_proposition_topics_async(
+        client, propositions, max_concurrency, batch_insert, skip_existing))
+
+
+def _parse_batch_output_line(line: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Extract the proposition id and the parsed structured output from one Batch API result line.
+
+    Returns:
+        Tuple (proposition_id, parsed) where parsed is None if the request failed.
+    """
+    result = json.loads(line)
+    proposition_id = int(result["custom_id"])
+    response = result.get("response") or {}
+    if result.get("error") or response.get("status_code") != 200:
+        return proposition_id, None
+
+    for item in response["body"].get("output", []):
+        if item.get("type") != "message":
+            continue
+        for content in item.get("content", []):
+            if content.get("type") == "output_text":
+                return proposition_id, json.loads(content["text"])
+    return proposition_id, None
+
+
+def _json_schema_format(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build the Responses API `text.format` for strict structured output from a Pydantic model.
+
+    Strict mode requires every property to be required and no additional properties,
+    which holds for the flat response schemas used here.
+    """
+    json_schema = schema.model_json_schema()
+    json_schema["additionalProperties"] = False
+    json_schema["required"] = list(json_schema.get("properties", {}))
+    return {"type": "json_schema", "name": schema.__name__, "schema": json_schema, "strict": True}
+
+
+def _split_batch_requests(lines: List[bytes]) -> List[List[bytes]]:
+    """
+    Split encoded request lines into chunks within BATCH_MAX_REQUESTS and BATCH_MAX_BYTES.
+    """
+    chunks: List[List[bytes]] = []
+    current: List[bytes] = []
+    size = 0
+    for line in lines:
+        if current and (len(current) >= BATCH_MAX_REQUESTS or size + len(line) > BATCH_MAX_BYTES):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _log_batch_errors(client: Any, batch: Any) -> int:
+    """
+    Log the requests listed in a batch's error file.
+
+    Returns:
+        Number of failed requests.
+    """
+    if not batch.error_file_id:
+        return 0
+
+    failed = 0
+    for line in client.files.content(batch.error_file_id).text.splitlines():
+        if not line:
+            continue
+        result = json.loads(line)
+        failed += 1
+        logger.warning("Batch request failed for proposition id %s: %s",
+                       result.get("custom_id"), result.get("error") or (result.get("response") or {}).get("body"))
+    return failed
+
+
+def submit_batch(client: Any,
+                 propositions: List[Tuple[int, str]],
+                 schema: Type[BaseModel],
+                 poll_interval: int = BATCH_POLL_INTERVAL) -> None:
+    """
+    Run summary/NER or topic classification through the OpenAI Batch API and store the results.
+
+    The Batch API is asynchronous (results within 24h) but costs half of the realtime
+    endpoint and has separate, higher rate limits, which suits the one-shot ingestion runs.
+    Each proposition becomes one /v1/responses request with the same input used by the
+    realtime functions. Requests are split into as many batches as the per-batch limits
+    require; the call blocks polling until all of them finish.
+
+    Args:
+        client: Synchronous OpenAI client instance (see create_openai_client).
+        propositions: List of tuples (proposition_id, full_text).
+        schema: ResponseSchema (summary/NER) or ResponseSchemaClassification (topics).
+        poll_interval: Seconds between batch status checks.
+    """
+    if schema is ResponseSchema:
+        build_input = _summary_input
+    elif schema is ResponseSchemaClassification:
+        build_input = _classification_input
+    else:
+        raise ValueError(f"Unsupported schema for batch processing: {schema.__name__}")
+
+    text_format = _json_schema_format(schema)
+    lines = []
+    for prop_id, text in propositions:
+        request = {
+            "custom_id": str(prop_id),
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {"model": LLM_MODEL, "input": build_input(text), "text": {"format": text_format}},
+        }
+        lines.append(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    batches = []
+    for chunk in _split_batch_requests(lines):
+        batch_file = client.files.create(file=("batch.jsonl", b"".join(chunk)), purpose="batch")
+        batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/responses", completion_window="24h")
+        logger.info("Submitted batch %s with %d requests", batch.id, len(chunk))
+        batches.append(batch)
+    del lines
+
+    for batch in batches:
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            logger.debug("Batch %s status: %s", batch.id, batch.status)
+
+        failed = _log_batch_errors(client, batch)
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error("Batch %s finished with status %s (%d failed requests)", batch.id, batch.status, failed)
+            continue
+
+        failed += _store_batch_output(client, batch.output_file_id, schema)
+        logger.info("Batch %s stored (%d failed requests).", batch.id, failed)
+
+
+def _store_batch_output(client: Any, output_file_id: str, schema: Type[BaseModel]) -> int:
+    """
+    Insert the results of a finished batch into the database.
+
+    Returns:
+        Number of requests in the output file that did not produce a usable response.
+    """
+    summaries: List[Tuple] = []
+    entities: List[Tuple] = []
+    topics: List[Tuple[int, str]] = []
+    failed = 0
+
+    def flush() -> None:
+        if summaries:
+            insert_proposition_summaries_batch(summaries)
+            summaries.clear()
+        if entities:
+            insert_proposition_entities_batch(entities)
+            entities.clear()
+        if topics:
+            insert_proposition_topics_batch(topics)
+            topics.clear()
+
+    output = client.files.content(output_file_id)
+    for line in output.text.splitlines():
+        if not line:
+            continue
+        prop_id, parsed = _parse_batch_output_line(line)
+        if parsed is None:
+            failed += 1
+            logger.warning("Batch request failed for proposition id: %d", prop_id)
+            continue
+
+        if schema is ResponseSchema:
+            prop_summaries, prop_entities = _summary_rows(prop_id, parsed)
+            summaries.extend(prop_summaries)
+            entities.extend(prop_entities)
+        else:
+            topics.append((prop_id, parsed.get("topic")))
+
+        if len(summaries) + len(entities) + len(topics) >= BATCH_INSERT_SIZE:
+            flush()
+
+    flush()
+    return failed
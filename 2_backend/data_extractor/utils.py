@@ -1,29 +1,32 @@
 import re
 import collections
-from typing import List, Tuple
+from typing import FrozenSet, List, Tuple
 
 
+# Characters removed before tokenization (anything that is not a word char or whitespace)
+_RE_NONWORD = re.compile(r"[^\w\s]")
+
 # Minimal NLTK stopwords lazy loader to avoid heavy imports at module import time
 _stop_words = None
 
 
-def _load_stopwords() -> set:
+def _load_stopwords() -> FrozenSet[str]:
     """
     Lazily load NLTK Portuguese stopwords. Downloads the package if necessary.
 
     Returns:
-        A set with Portuguese stopwords.
+        An immutable set with Portuguese stopwords, shared by all callers.
     """
     global _stop_words
     if _stop_words is None:
         try:
             from nltk.corpus import stopwords
-            _stop_words = set(stopwords.words('portuguese'))
+            _stop_words = frozenset(stopwords.words('portuguese'))
         except Exception:
             import nltk
             nltk.download('stopwords')
             from nltk.corpus import stopwords
-            _stop_words = set(stopwords.words('portuguese'))
+            _stop_words = frozenset(stopwords.words('portuguese'))
     return _stop_words
 
 
@@ -39,10 +42,10 @@ def generate_word_cloud(proposition_id: int, full_text: str) -> List[Tuple[int,
         A list of tuples (proposition_id, word, frequency).
     """
     stop_words = _load_stopwords()
-    text = (full_text or "").lower()
-    text = re.sub(r"[^\w\s]", "", text)
-    words = text.split()
-    filtered_words = [w for w in words if w not in stop_words]
-    word_counts = collections.Counter(filtered_words)
+    text = _RE_NONWORD.sub("", (full_text or "").lower())
+    # Count every token in C first, then drop stopwords from the (much smaller) vocabulary
+    word_counts = collections.Counter(text.split())
+    for word in stop_words & word_counts.keys():
+        del word_counts[word]
     return [(int(proposition_id), word, count) for word, count in word_counts.items()]
 
@@ -11,16 +11,34 @@ from data_extractor.extractor import (
     extract_propositions,
     generate_and_insert_word_clouds,
 )
-from data_extractor.openai_service import create_openai_client
-from data_extractor.use_cases import process_propositions_in_parallel, classify_and_store_proposition_topics
+from data_extractor.openai_service import create_async_openai_client
+from data_extractor.use_cases import process_propositions_async, classify_and_store_proposition_topics_async
 from data_extractor.repository import insert_authors_batch, insert_propositions_batch, fetch_propositions_for_classification
 
+import asyncio
 import logging
+from typing import Any
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+async def run_llm_stages(client: Any, df_propositions: Any) -> None:
+    """
+    Run both LLM stages (summaries/entities, then topics) on a single event loop and client.
+    """
+    async with client:
+        logger.info("Processing propositions with OpenAI...")
+        await process_propositions_async(client, df_propositions)
+
+        logger.info("Fetching propositions for topic classification...")
+        props = fetch_propositions_for_classification()
+        logger.info(f"Fetched {len(props)} propositions for classification")
+
+        logger.info("Classifying and storing proposition topics...")
+        await classify_and_store_proposition_topics_async(client, propositions=props)
+
+
 def main() -> None:
     """
     Main orchestration function:
@@ -32,18 +50,18 @@ def main() -> None:
     try:
         # 1. Load data
         logger.info("Loading propositions dataset...")
-        df_authors, df_propositions_filtered, df_propositions = load_propositions_dataset()
+        df_propositions = load_propositions_dataset()
         logger.info(f"Loaded {len(df_propositions)} propositions")
 
         # 2. Authors
         logger.info("Extracting and inserting authors...")
-        authors = extract_unique_authors(df_authors)
+        authors = extract_unique_authors(df_propositions["autores"])
         insert_authors_batch(authors)
         logger.info(f"Inserted {len(authors)} authors")
 
         # 3. Propositions
         logger.info("Extracting and inserting propositions...")
-        propositions = extract_propositions(df_propositions_filtered)
+        propositions = extract_propositions(df_propositions)
         insert_propositions_batch(propositions)
         logger.info(f"Inserted {len(propositions)} propositions")
 
@@ -54,18 +72,9 @@ def main() -> None:
 
         # 5. OpenAI processing
         logger.info("Creating OpenAI client...")
-        client = create_openai_client()
+        client = create_async_openai_client()
+        asyncio.run(run_llm_stages(client, df_propositions))
 
-        logger.info("Processing propositions with OpenAI...")
-        process_propositions_in_parallel(client, df_propositions, max_workers=3)
-        
-        logger.info("Fetching propositions for topic classification...")
-        props = fetch_propositions_for_classification()
-        logger.info(f"Fetched {len(props)} propositions for classification")
-        
-        logger.info("Classifying and storing proposition topics...")
-        classify_and_store_proposition_topics(client, propositions=props, max_workers=10)
-        
         logger.info("Pipeline execution completed successfully!")
 
     except FileNotFoundError as e:
@@ -1,5 +1,5 @@
 import logging
-from data_extractor.db import get_db_connection
+from data_extractor.db import borrow_conn
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +9,9 @@ def create_tables() -> None:
     Create required database tables for the data extractor, including
     the new proposition_themes table used to store theme classifications.
     """
+    # Every table's primary key starts with `id`, so lookups and joins by proposition id
+    # (including the proposition_ner / proposition_word_cloud composite keys) are already
+    # served by the primary key index; a separate index on `id` would only slow down inserts.
     statements = [
         """
         CREATE TABLE IF NOT EXISTS proposition_word_cloud (
@@ -60,19 +63,17 @@ def create_tables() -> None:
         """
     ]
 
-    conn = get_db_connection()
     try:
-        with conn:
+        with borrow_conn() as conn, conn:
             with conn.cursor() as cur:
+                # One round-trip for the whole migration instead of one per statement
+                cur.execute("\n".join(statements))
                 for sql in statements:
-                    cur.execute(sql)
-                    logger.debug("Executed migration SQL: %s", sql.splitlines()[0])
+                    logger.debug("Executed migration SQL: %s", sql.strip().splitlines()[0])
         logger.info("Database migrations applied successfully.")
     except Exception as exc:
         logger.exception("Failed to apply migrations: %s", exc)
         raise
-    finally:
-        conn.close()
 
 
 if __name__ == "__main__":